@@ -1,124 +1,179 @@
 import streamlit as st
 import pandas as pd
 import networkx as nx
-import matplotlib.pyplot as plt
-import random
+from matplotlib.figure import Figure
 import time
+import io
+import os
+import threading
+from graph_kernels import to_csr, simulate_network_events, dijkstra_path, bellman_ford_path, single_source_paths, spring_layout
 
 st.set_page_config(page_title="PathSim:Network Routing Simulator", layout="wide")
 
 # === Load Dataset ===
+DATA_FILE = "router_connections_dataset.csv"
+
+# Every simulation produces a new topology, so the per-topology caches below
+# (shared by all sessions) are bounded to a handful of recent topologies
+TOPOLOGY_CACHE_SIZE = 16
+
 @st.cache_data
-def load_data(filename):
+def load_data(filename, mtime):
     df = pd.read_csv(filename)
-    return df[df['Weight'] >= 0]
-
-df = load_data("router_connections_dataset.csv")
+    return df[df['Weight'] >= 0].reset_index(drop=True)
 
 st.title("📡PathSim: Network Routing Simulator")
 
 # === Build graph ===
 def build_graph(df):
-    G = nx.DiGraph()
-    for _, row in df.iterrows():
-        G.add_edge(row['Source'], row['Destination'], weight=row['Weight'])
-    return G
-
-G = build_graph(df)
+    return nx.from_pandas_edgelist(df.rename(columns={'Weight': 'weight'}), source='Source', target='Destination',
+                                   edge_attr='weight', create_using=nx.DiGraph())
+
+def graph_key(G):
+    return hash(frozenset(G.edges(data='weight')))
+
+# The current topology lives in session state; caches below are keyed on graph_key,
+# which is recomputed only when topology_version changes
+def store_topology(G, csr):
+    st.session_state.G = G
+    st.session_state.csr = csr
+    st.session_state.graph_key = graph_key(G)
+
+# Rebuild from the CSV only on first run or when the file has changed on disk
+data_mtime = os.path.getmtime(DATA_FILE)
+if st.session_state.get('data_mtime') != data_mtime:
+    G = build_graph(load_data(DATA_FILE, data_mtime))
+    store_topology(G, to_csr(G))
+    st.session_state.topology_version = 0
+    st.session_state.data_mtime = data_mtime
+
+G = st.session_state.G
+csr = st.session_state.csr
+node_str = csr.node_str
 
 # === Visualization ===
+EDGE_LABEL_LIMIT = 200
+
+@st.cache_data(max_entries=TOPOLOGY_CACHE_SIZE)
+def _layout(nodes_tuple, edges_tuple):
+    return spring_layout(nodes_tuple, edges_tuple, seed=42)
+
+# One Figure shared by every render; the lock serializes sessions drawing into it
+@st.cache_resource
+def _figure():
+    fig = Figure(figsize=(10, 7))
+    return fig, fig.subplots(), threading.Lock()
+
+# A topology is typically drawn plain plus with a couple of highlighted paths
+@st.cache_data(max_entries=TOPOLOGY_CACHE_SIZE * 4)
+def render_graph_png(nodes_tuple, edges_tuple, highlight_tuple):
+    G = nx.DiGraph()
+    G.add_nodes_from(nodes_tuple)
+    G.add_weighted_edges_from(edges_tuple)
+    pos = _layout(nodes_tuple, tuple((u, v) for u, v, _ in edges_tuple))
+    edge_list = list(zip(highlight_tuple[:-1], highlight_tuple[1:]))
+
+    # Dense graphs only get labels on the highlighted path
+    if len(edges_tuple) <= EDGE_LABEL_LIMIT:
+        edge_labels = nx.get_edge_attributes(G, 'weight')
+    else:
+        edge_labels = {e: G.edges[e]['weight'] for e in edge_list}
+
+    fig, ax, lock = _figure()
+    with lock:
+        ax.clear()
+        nx.draw(G, pos, ax=ax, with_labels=True, node_color='lightblue', node_size=800, arrowsize=15)
+        if edge_labels:
+            nx.draw_networkx_edge_labels(G, pos, ax=ax, edge_labels=edge_labels, font_color='red')
+        if edge_list:
+            nx.draw_networkx_edges(G, pos, ax=ax, edgelist=edge_list, edge_color='green', width=3)
+        ax.set_title("Network Topology", fontsize=16)
+        ax.axis('off')
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=100)
+    return buf.getvalue()
+
 def draw_graph(G, highlight_path=None):
-    pos = nx.spring_layout(G, seed=42)
-    plt.figure(figsize=(10, 7))
-    nx.draw(G, pos, with_labels=True, node_color='lightblue', node_size=800, arrowsize=15)
-    edge_labels = nx.get_edge_attributes(G, 'weight')
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_color='red')
-    
-    if highlight_path:
-        edge_list = list(zip(highlight_path[:-1], highlight_path[1:]))
-        nx.draw_networkx_edges(G, pos, edgelist=edge_list, edge_color='green', width=3)
-    
-    plt.title("Network Topology", fontsize=16)
-    plt.axis('off')
-    st.pyplot(plt.gcf())
-    plt.clf()
-
-st.subheader("Original Network Topology")
+    st.image(render_graph_png(tuple(sorted(G.nodes())), tuple(sorted(G.edges(data='weight'))),
+                              tuple(highlight_path or ())))
+
+if st.session_state.topology_version == 0:
+    st.subheader("Original Network Topology")
+else:
+    st.subheader(f"Current Network Topology (simulation #{st.session_state.topology_version})")
 draw_graph(G)
 
 # === Simulate Network Events ===
-def simulate_network_events(G):
-    G = G.copy()
-    for edge in list(G.edges()):
-        event_type = random.choice(['remove', 'update'])
-        if event_type == 'remove':
-            G.remove_edge(*edge)
-        else:
-            new_weight = random.randint(1, 20)
-            G[edge[0]][edge[1]]['weight'] = new_weight
-    return G
-
 if st.button("Simulate Network Events (Random Changes)"):
-    G = simulate_network_events(G)
+    csr = simulate_network_events(csr)
+    G = csr.to_graph()
+    store_topology(G, csr)
+    st.session_state.topology_version += 1
     st.success("Network updated with random edge removals and weight changes.")
     draw_graph(G)
 
+# === Shortest Path Cache ===
+@st.cache_data(max_entries=TOPOLOGY_CACHE_SIZE * 32)
+def cached_sssp(graph_key, _csr, source):
+    return single_source_paths(_csr, source)
+
 # === Routing Table for Node ===
 st.subheader("Generate Routing Table")
-node = st.selectbox("Select a Router:", sorted(G.nodes()))
+nodes = sorted(G.nodes())  # shared by the three router selectboxes
+node = st.selectbox("Select a Router:", nodes)
 if node:
+    lengths, paths = cached_sssp(st.session_state.graph_key, csr, node)
     data = []
     for target in G.nodes():
         if target == node:
             continue
-        try:
-            path = nx.dijkstra_path(G, node, target, weight='weight')
-            cost = nx.dijkstra_path_length(G, node, target, weight='weight')
-            path_str = " ➝ ".join(path)
-        except nx.NetworkXNoPath:
-            cost = float('inf')
-            path_str = "N/A"
+        path = paths.get(target)
+        cost = lengths.get(target, float('inf'))
+        path_str = " ➝ ".join(node_str[n] for n in path) if path else "N/A"
         data.append({"Destination": target, "Cost": cost, "Path": path_str})
     df_table = pd.DataFrame(data)
     st.dataframe(df_table)
 
 # === Shortest Path Algorithms ===
+def timed_path(find_path, *args):
+    start = time.time()
+    try:
+        path, cost = find_path(*args)
+    except nx.NetworkXNoPath:
+        return None, None, None
+    return path, cost, (time.time() - start) * 1000  # convert to milliseconds
+
 st.subheader("Find Shortest Path")
 
 col1, col2 = st.columns(2)
 with col1:
-    source = st.selectbox("Select Source Router:", sorted(G.nodes()), key='source')
+    source = st.selectbox("Select Source Router:", nodes, key='source')
 with col2:
-    target = st.selectbox("Select Destination Router:", sorted(G.nodes()), key='target')
+    target = st.selectbox("Select Destination Router:", nodes, key='target')
 
 if source and target and source != target:
     st.write(f"### Shortest paths from {source} to {target}:")
 
+    # Each algorithm is timed on a full single-pair solve.
+    # Both runs are skipped when the source's cached routing result has no entry for the target
+    if target in cached_sssp(st.session_state.graph_key, csr, source)[0]:
+        path_d, cost_d, time_d = timed_path(dijkstra_path, csr, source, target)
+        path_bf, cost_bf, time_bf = timed_path(bellman_ford_path, csr, source, target)
+    else:
+        path_d, cost_d, time_d = None, None, None
+        path_bf, cost_bf, time_bf = None, None, None
+
     # Dijkstra
-    try:
-        start_d = time.time()
-        path_d = nx.dijkstra_path(G, source, target, weight='weight')
-        cost_d = nx.dijkstra_path_length(G, source, target, weight='weight')
-        end_d = time.time()
-        time_d = (end_d - start_d) * 1000  # convert to milliseconds
-        st.markdown(f"**Dijkstra Path:** { ' ➝ '.join(path_d) }  \n**Cost:** {cost_d}  \n**Time taken:** {time_d:.2f} ms")
-    except nx.NetworkXNoPath:
+    if path_d:
+        st.markdown(f"**Dijkstra Path:** { ' ➝ '.join(node_str[n] for n in path_d) }  \n**Cost:** {cost_d}  \n**Time taken:** {time_d:.2f} ms")
+    else:
         st.warning("Dijkstra algorithm: No path found.")
-        path_d = None
-        time_d = None
 
     # Bellman-Ford
-    try:
-        start_bf = time.time()
-        path_bf = nx.bellman_ford_path(G, source, target, weight='weight')
-        cost_bf = nx.bellman_ford_path_length(G, source, target, weight='weight')
-        end_bf = time.time()
-        time_bf = (end_bf - start_bf) * 1000
-        st.markdown(f"**Bellman-Ford Path:** { ' ➝ '.join(path_bf) }  \n**Cost:** {cost_bf}  \n**Time taken:** {time_bf:.2f} ms")
-    except nx.NetworkXNoPath:
+    if path_bf:
+        st.markdown(f"**Bellman-Ford Path:** { ' ➝ '.join(node_str[n] for n in path_bf) }  \n**Cost:** {cost_bf}  \n**Time taken:** {time_bf:.2f} ms")
+    else:
         st.warning("Bellman-Ford algorithm: No path found.")
-        path_bf = None
-        time_bf = None
 
     # Visualize paths
     if path_d:
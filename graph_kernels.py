@@ -0,0 +1,188 @@
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+import networkx as nx
+from numba import njit
+from scipy.sparse import csr_matrix, csgraph
+
+rng = np.random.default_rng()
+
+# === CSR Graph ===
+# Removed edges keep their slot with weight inf, so the structure never changes.
+# int_weights records that every live weight is a whole number (set by simulation),
+# so weights and path costs are reported as ints like NetworkX did
+@dataclass
+class GraphCSR:
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+    node_ids: list
+    id_to_idx: dict
+    int_weights: bool = False
+
+    def copy(self):
+        return GraphCSR(self.indptr, self.indices, self.weights.copy(), self.node_ids, self.id_to_idx,
+                        self.int_weights)
+
+    @cached_property
+    def node_str(self):
+        return {n: str(n) for n in self.node_ids}
+
+    @cached_property
+    def matrix(self):
+        n = len(self.node_ids)
+        u_arr = np.repeat(np.arange(n), np.diff(self.indptr))
+        live = np.isfinite(self.weights)
+        return csr_matrix((self.weights[live], (u_arr[live], self.indices[live])), shape=(n, n))
+
+    def to_graph(self):
+        G = nx.DiGraph()
+        G.add_nodes_from(self.node_ids)
+        u_arr = np.repeat(np.arange(len(self.node_ids)), np.diff(self.indptr))
+        live = np.flatnonzero(np.isfinite(self.weights))
+        G.add_weighted_edges_from(
+            (self.node_ids[u_arr[k]], self.node_ids[self.indices[k]], _as_weight(self.weights[k], self.int_weights)) for k in live
+        )
+        return G
+
+def to_csr(G):
+    node_ids = list(G.nodes())
+    id_to_idx = {n: i for i, n in enumerate(node_ids)}
+    indptr = np.zeros(len(node_ids) + 1, dtype=np.int32)
+    indices = np.empty(G.number_of_edges(), dtype=np.int32)
+    weights = np.empty(G.number_of_edges(), dtype=np.float64)
+    k = 0
+    for i, n in enumerate(node_ids):
+        for nbr, attrs in G.adj[n].items():
+            indices[k] = id_to_idx[nbr]
+            weights[k] = attrs['weight']
+            k += 1
+        indptr[i + 1] = k
+    return GraphCSR(indptr, indices, weights, node_ids, id_to_idx)
+
+# === Network Event Simulation ===
+def simulate_network_events(csr):
+    csr = csr.copy()
+    live = np.flatnonzero(np.isfinite(csr.weights))
+    events = rng.integers(0, 2, size=len(live))  # 0=remove, 1=update
+    new_weights = rng.integers(1, 21, size=len(live))
+    csr.weights[live[events == 0]] = np.inf
+    csr.weights[live[events == 1]] = new_weights[events == 1]
+    csr.int_weights = True
+    return csr
+
+# === Shortest-Path Kernels (scipy.sparse.csgraph) ===
+def _path_tree(dist, preds):
+    parent = preds.astype(np.int32)
+    parent[parent < 0] = -1
+    return dist, parent
+
+def dijkstra_csr(csr, src):
+    return _path_tree(*csgraph.dijkstra(csr.matrix, indices=src, return_predecessors=True))
+
+def bellman_ford_csr(csr, src):
+    try:
+        return _path_tree(*csgraph.bellman_ford(csr.matrix, indices=src, return_predecessors=True))
+    except csgraph.NegativeCycleError:
+        raise nx.NetworkXUnbounded("Negative cycle detected.")
+
+# === Path Helpers ===
+def _as_weight(value, int_weights):
+    return int(value) if int_weights else float(value)
+
+def _pair_index(id_to_idx, source, target):
+    if source not in id_to_idx or target not in id_to_idx:
+        raise nx.NodeNotFound(f"Either source {source} or target {target} is not in G")
+    return id_to_idx[source], id_to_idx[target]
+
+def _reconstruct_path(parent, node_ids, dst):
+    path = []
+    v = dst
+    while v != -1:
+        path.append(node_ids[v])
+        v = parent[v]
+    return path[::-1]
+
+def dijkstra_path(csr, source, target):
+    src, dst = _pair_index(csr.id_to_idx, source, target)
+    dist, parent = dijkstra_csr(csr, src)
+    if not np.isfinite(dist[dst]):
+        raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+    return _reconstruct_path(parent, csr.node_ids, dst), _as_weight(dist[dst], csr.int_weights)
+
+def bellman_ford_path(csr, source, target):
+    src, dst = _pair_index(csr.id_to_idx, source, target)
+    dist, parent = bellman_ford_csr(csr, src)
+    if not np.isfinite(dist[dst]):
+        raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+    return _reconstruct_path(parent, csr.node_ids, dst), _as_weight(dist[dst], csr.int_weights)
+
+def single_source_paths(csr, source):
+    if source not in csr.id_to_idx:
+        raise nx.NodeNotFound(f"Node {source} not found in graph")
+    dist, parent = dijkstra_csr(csr, csr.id_to_idx[source])
+    lengths, paths = {}, {}
+    for dst in np.flatnonzero(np.isfinite(dist)):
+        target = csr.node_ids[dst]
+        lengths[target] = _as_weight(dist[dst], csr.int_weights)
+        paths[target] = _reconstruct_path(parent, csr.node_ids, dst)
+    return lengths, paths
+
+# === Fruchterman-Reingold Layout Kernel ===
+@njit(cache=True)
+def fr_layout(pos, edges_u, edges_v, n_iter, k):
+    n = pos.shape[0]
+    t = 0.1
+    dt = t / (n_iter + 1)
+    for _ in range(n_iter):
+        disp = np.zeros((n, 2))
+
+        # Pairwise repulsion k^2 / r
+        for i in range(n):
+            for j in range(n):
+                if i == j:
+                    continue
+                dx = pos[i, 0] - pos[j, 0]
+                dy = pos[i, 1] - pos[j, 1]
+                r2 = max(dx * dx + dy * dy, 1e-4)
+                disp[i, 0] += dx * k * k / r2
+                disp[i, 1] += dy * k * k / r2
+
+        # Edge attraction r^2 / k
+        for e in range(edges_u.shape[0]):
+            u = edges_u[e]
+            v = edges_v[e]
+            dx = pos[u, 0] - pos[v, 0]
+            dy = pos[u, 1] - pos[v, 1]
+            r = np.sqrt(dx * dx + dy * dy)
+            disp[u, 0] -= dx * r / k
+            disp[u, 1] -= dy * r / k
+            disp[v, 0] += dx * r / k
+            disp[v, 1] += dy * r / k
+
+        # Move each node by at most the current temperature
+        for i in range(n):
+            length = np.sqrt(disp[i, 0] ** 2 + disp[i, 1] ** 2)
+            if length > 0:
+                scale = min(length, t) / length
+                pos[i, 0] += disp[i, 0] * scale
+                pos[i, 1] += disp[i, 1] * scale
+        t -= dt
+    return pos
+
+def spring_layout(nodes, edges, seed=42, iterations=50):
+    if not nodes:
+        return {}
+    idx = {n: i for i, n in enumerate(nodes)}
+    edges_u = np.array([idx[u] for u, _ in edges], dtype=np.int32)
+    edges_v = np.array([idx[v] for _, v in edges], dtype=np.int32)
+    pos = np.random.default_rng(seed).random((len(nodes), 2))
+    pos = fr_layout(pos, edges_u, edges_v, iterations, 1.0 / np.sqrt(max(len(nodes), 1)))
+
+    # Center on the origin and scale into [-1, 1] like nx.spring_layout
+    pos -= pos.mean(axis=0)
+    lim = np.abs(pos).max()
+    if lim > 0:
+        pos /= lim
+    return {n: pos[i] for i, n in enumerate(nodes)}
@@ -3,7 +3,8 @@ import networkx as nx
 import matplotlib.pyplot as plt
 import time
 import os
-import random
+from functools import lru_cache
+from graph_kernels import to_csr, simulate_network_events, dijkstra_path, bellman_ford_path, single_source_paths, spring_layout
 
 # === STEP 1: Load the dataset ===
 file_name = "router_connections_dataset.csv"
@@ -17,34 +18,46 @@ print("Raw Dataset:")
 print(df.head())
 
 # === STEP 2: Filter out negative weights ===
-df = df[df['Weight'] >= 0]
+df = df[df['Weight'] >= 0].reset_index(drop=True)
 print("\nFiltered Dataset (no negative weights):")
 print(df.head())
 
 # === STEP 3: Create the graph ===
-G = nx.DiGraph()
-for _, row in df.iterrows():
-    G.add_edge(row['Source'], row['Destination'], weight=row['Weight'])
+G = nx.from_pandas_edgelist(df.rename(columns={'Weight': 'weight'}), source='Source', target='Destination',
+                            edge_attr='weight', create_using=nx.DiGraph())
 
 # === STEP 4: Visualization Function ===
-def visualize_graph(G, highlight_path=None, title="Network Topology", filename=None):
-    pos = nx.spring_layout(G, seed=42)
-    edge_labels = nx.get_edge_attributes(G, 'weight')
+EDGE_LABEL_LIMIT = 200
+
+@lru_cache(maxsize=None)
+def _layout(nodes_tuple, edges_tuple):
+    return spring_layout(nodes_tuple, edges_tuple, seed=42)
+
+def visualize_graph(G, highlight_path=None, title="Network Topology", filename=None, publication=False):
+    pos = _layout(tuple(sorted(G.nodes())), tuple(sorted(G.edges())))
+    edge_list = list(zip(highlight_path[:-1], highlight_path[1:])) if highlight_path else []
+
+    # Dense graphs only get labels on the highlighted path
+    if G.number_of_edges() <= EDGE_LABEL_LIMIT:
+        edge_labels = nx.get_edge_attributes(G, 'weight')
+    else:
+        edge_labels = {e: G.edges[e]['weight'] for e in edge_list}
 
     plt.figure(figsize=(10, 7))
     nx.draw(G, pos, with_labels=True, node_color='lightblue', node_size=1000, arrows=True)
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_color='red')
+    if edge_labels:
+        nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_color='red')
 
-    if highlight_path:
-        edge_list = list(zip(highlight_path[:-1], highlight_path[1:]))
+    if edge_list:
         nx.draw_networkx_edges(G, pos, edgelist=edge_list, edge_color='green', width=2, label='Shortest Path')
 
     plt.title(title, fontsize=14, fontweight='bold')
     plt.axis('off')
-    plt.tight_layout()
+    if publication:
+        plt.tight_layout()
 
     if filename:
-        plt.savefig(filename, dpi=300)
+        plt.savefig(filename, dpi=300 if publication else 100)
         print(f"Saved visualization as: {filename}")
     plt.show()
 
@@ -52,47 +65,33 @@ def visualize_graph(G, highlight_path=None, title="Network Topology", filename=N
 visualize_graph(G, title="Original Network Topology", filename="1_original_network.png")
 
 # === STEP 6: Network Event Simulation ===
-def simulate_network_events(G):
-    print("\nSimulating network events (random edge removals or weight changes)...")
-    for edge in list(G.edges()):
-        event_type = random.choice(['remove', 'update'])
-        if event_type == 'remove':
-            G.remove_edge(*edge)
-            # Removed verbose print here
-        elif event_type == 'update':
-            new_weight = random.randint(1, 20)
-            G[edge[0]][edge[1]]['weight'] = new_weight
-            # Removed verbose print here
-    print("Simulation complete.\n")
-    return G
-
-G = simulate_network_events(G)
+print("\nSimulating network events (random edge removals or weight changes)...")
+csr = simulate_network_events(to_csr(G))
+G = csr.to_graph()
+print("Simulation complete.\n")
 
 # === STEP 7: Post-Update Visualization ===
 visualize_graph(G, title="Updated Network After Simulation", filename="2_updated_network.png")
 
 
 # === STEP 8: Routing Table Generation for User-Selected Node ===
-def generate_routing_table_for_node(G, node):
+def generate_routing_table_for_node(G, csr, node):
     if node not in G.nodes():
         print(f"❌ Node '{node}' not found in the graph.")
         return None
 
     print(f"\n📌 Routing Table for Node '{node}':")
+    lengths, paths = single_source_paths(csr, node)
     data = []
     for target in G.nodes():
         if target == node:
             continue
-        try:
-            path = nx.dijkstra_path(G, node, target, weight='weight')
-            cost = nx.dijkstra_path_length(G, node, target, weight='weight')
-        except nx.NetworkXNoPath:
-            path = None
-            cost = float('inf')
+        cost = lengths.get(target, float('inf'))
+        path = paths.get(target)
         data.append({
             "Destination": target,
             "Cost": cost,
-            "Path": " ➝ ".join(path) if path else "N/A"
+            "Path": " ➝ ".join(csr.node_str[n] for n in path) if path else "N/A"
         })
 
     df_table = pd.DataFrame(data)
@@ -100,45 +99,45 @@ def generate_routing_table_for_node(G, node):
     return data
 
 # === STEP 9: Algorithm Function ===
-def run_algorithms(G, source, target):
+def run_algorithms(csr, source, target):
     print(f"\nShortest Paths from {source} to {target}:\n")
 
     # Dijkstra
     try:
         start = time.time()
-        path_d = nx.dijkstra_path(G, source, target, weight='weight')
+        path_d, cost_d = dijkstra_path(csr, source, target)
         time_d = time.time() - start
         print("Dijkstra Path:", path_d)
-        print("  ➤ Total Cost:", nx.dijkstra_path_length(G, source, target, weight='weight'))
+        print("  ➤ Total Cost:", cost_d)
         print("  ⏱️ Time Taken:", round(time_d, 6), "sec")
     except Exception as e:
         print("Dijkstra failed:", e)
-        path_d = []
+        path_d, cost_d = [], None
 
     # Bellman-Ford
     try:
         start = time.time()
-        path_bf = nx.bellman_ford_path(G, source, target, weight='weight')
+        path_bf, cost_bf = bellman_ford_path(csr, source, target)
         time_bf = time.time() - start
         print("\nBellman-Ford Path:", path_bf)
-        print("  ➤ Total Cost:", nx.bellman_ford_path_length(G, source, target, weight='weight'))
+        print("  ➤ Total Cost:", cost_bf)
         print("  ⏱️ Time Taken:", round(time_bf, 6), "sec")
     except Exception as e:
         print("Bellman-Ford failed:", e)
-        path_bf = []
+        path_bf, cost_bf = [], None
 
-    return path_d, path_bf
+    return path_d, cost_d, path_bf, cost_bf
 
 # === STEP 10: Take User Input ===
 print("\nRouters in the network:", list(G.nodes))
 selected_node = input("Enter the Router to generate routing table for: ").strip()
-generate_routing_table_for_node(G, selected_node)
+generate_routing_table_for_node(G, csr, selected_node)
 print("\nENTER NODES TO SIMULATE PATH FOR")
 source = input("Enter Source Router: ").strip()
 destination = input("Enter Destination Router: ").strip()
 
 # === STEP 11: Run Algorithms and Visualize ===
-path_d, path_bf = run_algorithms(G, source, destination)
+path_d, cost_d, path_bf, cost_bf = run_algorithms(csr, source, destination)
 
 visualize_graph(G, highlight_path=path_d, title="Dijkstra Shortest Path After Simulation", filename="3_dijkstra_path.png")
 visualize_graph(G, highlight_path=path_bf, title="Bellman-Ford Shortest Path After Simulation", filename="4_bellman_ford_path.png")
@@ -147,9 +146,6 @@ visualize_graph(G, highlight_path=path_bf, title="Bellman-Ford Shortest Path Aft
 print("\n📌 Final Recommendation:")
 
 if path_d and path_bf:
-    cost_d = nx.dijkstra_path_length(G, source, destination, weight='weight')
-    cost_bf = nx.bellman_ford_path_length(G, source, destination, weight='weight')
-
     if cost_d < cost_bf:
         print(f"✅ Use Dijkstra: Lower cost ({cost_d} < {cost_bf})")
     elif cost_bf < cost_d:
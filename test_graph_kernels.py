@@ -0,0 +1,128 @@
+import os
+
+import numpy as np
+import pandas as pd
+import networkx as nx
+import pytest
+
+import graph_kernels
+from graph_kernels import (to_csr, simulate_network_events, dijkstra_path, bellman_ford_path,
+                           single_source_paths, spring_layout)
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "router_connections_dataset.csv")
+
+
+def load_graph():
+    df = pd.read_csv(DATA_FILE)
+    df = df[df['Weight'] >= 0].reset_index(drop=True)
+    return nx.from_pandas_edgelist(df.rename(columns={'Weight': 'weight'}), source='Source', target='Destination',
+                                   edge_attr='weight', create_using=nx.DiGraph())
+
+
+@pytest.fixture(scope="module", params=["original", "simulated"])
+def topology(request):
+    csr = to_csr(load_graph())
+    if request.param == "simulated":
+        # Two rounds leave enough edges removed for some targets to become unreachable
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(graph_kernels, "rng", np.random.default_rng(0))
+            csr = simulate_network_events(simulate_network_events(csr))
+    return csr, csr.to_graph()
+
+
+def check_path(G, path, cost, source, target):
+    assert path[0] == source and path[-1] == target
+    assert nx.path_weight(G, path, 'weight') == pytest.approx(cost)
+
+
+def test_to_graph_round_trip():
+    G = load_graph()
+    assert nx.utils.graphs_equal(to_csr(G).to_graph(), G)
+
+
+def test_simulation_only_touches_live_edges(monkeypatch):
+    monkeypatch.setattr(graph_kernels, "rng", np.random.default_rng(1))
+    csr = to_csr(load_graph())
+    once = simulate_network_events(csr)
+    twice = simulate_network_events(once)
+    assert np.isfinite(csr.weights).all()
+    assert np.isinf(twice.weights[np.isinf(once.weights)]).all()
+    live = np.isfinite(once.weights)
+    assert ((once.weights[live] >= 1) & (once.weights[live] <= 20)).all()
+
+
+def test_single_source_paths_matches_networkx(topology):
+    csr, G = topology
+    for source in G:
+        lengths, paths = single_source_paths(csr, source)
+        ref_lengths, _ = nx.single_source_dijkstra(G, source, weight='weight')
+        assert lengths.keys() == ref_lengths.keys()
+        for target, cost in lengths.items():
+            assert cost == pytest.approx(ref_lengths[target])
+            check_path(G, paths[target], cost, source, target)
+
+
+def test_point_to_point_queries_match_networkx(topology):
+    csr, G = topology
+    unreachable = 0
+    for source in G:
+        ref_lengths, _ = nx.single_source_dijkstra(G, source, weight='weight')
+        for target in G:
+            queries = [lambda: dijkstra_path(csr, source, target),
+                       lambda: bellman_ford_path(csr, source, target)]
+            if target not in ref_lengths:
+                unreachable += 1
+                for query in queries:
+                    with pytest.raises(nx.NetworkXNoPath):
+                        query()
+                continue
+            for query in queries:
+                path, cost = query()
+                assert cost == pytest.approx(ref_lengths[target])
+                check_path(G, path, cost, source, target)
+    if csr.int_weights:
+        assert unreachable > 0
+
+
+def test_source_equals_target(topology):
+    csr, G = topology
+    for source in list(G)[:10]:
+        assert dijkstra_path(csr, source, source) == ([source], 0)
+        assert bellman_ford_path(csr, source, source) == ([source], 0)
+        lengths, paths = single_source_paths(csr, source)
+        assert lengths[source] == 0 and paths[source] == [source]
+
+
+def test_unknown_router_raises_node_not_found():
+    csr = to_csr(load_graph())
+    for query in (lambda: dijkstra_path(csr, 'R1', 'R999'),
+                  lambda: bellman_ford_path(csr, 'R999', 'R1'),
+                  lambda: single_source_paths(csr, 'R999')):
+        with pytest.raises(nx.NodeNotFound):
+            query()
+
+
+def test_simulated_costs_are_integers(topology):
+    csr, G = topology
+    if not csr.int_weights:
+        assert all(isinstance(w, float) for _, _, w in G.edges(data='weight'))
+        return
+    assert all(isinstance(w, int) for _, _, w in G.edges(data='weight'))
+    lengths, _ = single_source_paths(csr, next(iter(G)))
+    assert all(isinstance(cost, int) for cost in lengths.values())
+
+
+def test_spring_layout_is_deterministic_and_scaled():
+    G = load_graph()
+    nodes, edges = tuple(sorted(G.nodes())), tuple(sorted(G.edges()))
+    pos = spring_layout(nodes, edges, seed=42)
+    assert pos.keys() == set(nodes)
+    coords = np.array([pos[n] for n in nodes])
+    assert np.isfinite(coords).all()
+    assert np.abs(coords).max() == pytest.approx(1.0)
+    again = spring_layout(nodes, edges, seed=42)
+    assert all(np.array_equal(pos[n], again[n]) for n in nodes)
+
+
+def test_spring_layout_of_empty_graph():
+    assert spring_layout((), ()) == {}